@@ -1,7 +1,9 @@
+import re
 from enum import Enum
 
 from htmlnode import ParentNode, LeafNode
-from inline_markdown import text_node_to_html_node, text_to_textnodes
+from inline_markdown import (text_node_to_html_node, text_node_to_html_str,
+                             text_to_textnodes)
 from textnode import TextNode, TextType
 
 
@@ -13,39 +15,62 @@ class BlockType(Enum):
     UNORDERED_LIST = "unordered_list"
     ORDERED_LIST = "ordered_list"
 
-def markdown_to_blocks(markdown):
-    blocks = markdown.split("\n\n")
-    result = []
-    for block in blocks:
-        stripped = block.strip()
-        if stripped != "":
-            result.append(stripped)
-    return result
+_BLOCK_SEPARATOR_RE = re.compile(r"\n{2,}")
 
-def block_to_block_type(block):
-    lines = block.split("\n")
-    
-    if block.startswith("#"):
-        for i in range(1, 7):
-            if block.startswith("#" * i + " "):
-                return BlockType.HEADING
-
-    if block.startswith("```") and block.endswith("```"):
-        return BlockType.CODE
-
-    if all(line.startswith(">") for line in lines):
-        return BlockType.QUOTE
-
-    if all(line.startswith("- ") for line in lines):
-        return BlockType.UNORDERED_LIST
-
-    is_ordered_list = True
-    for i, line in enumerate(lines):
-        expected_prefix = f"{i + 1}. "
-        if not line.startswith(expected_prefix):
-            is_ordered_list = False
-            break
-    if is_ordered_list:
+def markdown_to_blocks(markdown):
+    # Blocks are separated by one or more empty lines; a line holding only
+    # whitespace does not split a block
+    return [block for block in map(str.strip, _BLOCK_SEPARATOR_RE.split(markdown)) if block]
+
+def block_to_block_type(block, lines=None):
+    """
+    Classify a block. Callers that already split the block into lines can
+    pass them in to avoid splitting it again.
+    """
+    if not block:
+        return BlockType.PARAGRAPH
+
+    # Every block type is identified by its first character, so branch on it
+    # once instead of running each line-by-line check in turn
+    first = block[0]
+
+    if first == "#":
+        prefix = block[:7]
+        level = len(prefix) - len(prefix.lstrip("#"))
+        if level <= 6 and block[level:level + 1] == " ":
+            return BlockType.HEADING
+        return BlockType.PARAGRAPH
+
+    if first == "`":
+        if block.startswith("```") and block.endswith("```"):
+            return BlockType.CODE
+        return BlockType.PARAGRAPH
+
+    if lines is None:
+        lines = block.split("\n")
+
+    if first == ">":
+        if all(line.startswith(">") for line in lines):
+            return BlockType.QUOTE
+        return BlockType.PARAGRAPH
+
+    if first == "-":
+        if all(line.startswith("- ") for line in lines):
+            return BlockType.UNORDERED_LIST
+        return BlockType.PARAGRAPH
+
+    if first == "1":
+        for i, line in enumerate(lines, 1):
+            # Compare the number numerically instead of building f"{i}. " per
+            # line; the digit and leading-zero checks keep it just as strict
+            number, separator, _ = line.partition(". ")
+            if (
+                not separator
+                or not (number.isascii() and number.isdigit())
+                or number[0] == "0"
+                or int(number) != i
+            ):
+                return BlockType.PARAGRAPH
         return BlockType.ORDERED_LIST
 
     return BlockType.PARAGRAPH
@@ -58,26 +83,23 @@ def text_to_children(text):
         children.append(html_node)
     return children
 
-def paragraph_to_html_node(block):
-    lines = block.split("\n")
+def paragraph_to_html_node(block, lines=None):
+    if lines is None:
+        lines = block.split("\n")
     paragraph_text = " ".join(lines)
     children = text_to_children(paragraph_text)
     return ParentNode("p", children)
 
-def heading_to_html_node(block):
-    level = 0
-    for char in block:
-        if char == "#":
-            level += 1
-        else:
-            break
+def heading_to_html_node(block, lines=None):
+    level = len(block) - len(block.lstrip("#"))
 
     heading_text = block[level + 1:]
     children = text_to_children(heading_text)
     return ParentNode(f"h{level}", children)
 
-def code_to_html_node(block):
-    lines = block.split("\n")
+def code_to_html_node(block, lines=None):
+    if lines is None:
+        lines = block.split("\n")
     code_lines = lines[1:-1]
     code_text = "\n".join(code_lines)
     if code_text:
@@ -86,8 +108,9 @@ def code_to_html_node(block):
     code_node = LeafNode(None, code_text)
     return ParentNode("pre", [ParentNode("code", [code_node])])
 
-def quote_to_html_node(block):
-    lines = block.split("\n")
+def quote_to_html_node(block, lines=None):
+    if lines is None:
+        lines = block.split("\n")
     stripped_lines = []
     for line in lines:
         if line.startswith(">"):
@@ -98,8 +121,9 @@ def quote_to_html_node(block):
     children = text_to_children(quote_text)
     return ParentNode("blockquote", children)
 
-def unordered_list_to_html_node(block):
-    lines = block.split("\n")
+def unordered_list_to_html_node(block, lines=None):
+    if lines is None:
+        lines = block.split("\n")
     list_items = []
     for line in lines:
         item_text = line[2:]
@@ -107,33 +131,30 @@ def unordered_list_to_html_node(block):
         list_items.append(ParentNode("li", children))
     return ParentNode("ul", list_items)
 
-def ordered_list_to_html_node(block):
-    lines = block.split("\n")
+def ordered_list_to_html_node(block, lines=None):
+    if lines is None:
+        lines = block.split("\n")
     list_items = []
-    for i, line in enumerate(lines):
-        prefix = f"{i + 1}. "
-        item_text = line[len(prefix):]
+    for line in lines:
+        item_text = line.partition(". ")[2]
         children = text_to_children(item_text)
         list_items.append(ParentNode("li", children))
     return ParentNode("ol", list_items)
 
+_BLOCK_CONVERTERS = {
+    BlockType.PARAGRAPH: paragraph_to_html_node,
+    BlockType.HEADING: heading_to_html_node,
+    BlockType.CODE: code_to_html_node,
+    BlockType.QUOTE: quote_to_html_node,
+    BlockType.UNORDERED_LIST: unordered_list_to_html_node,
+    BlockType.ORDERED_LIST: ordered_list_to_html_node,
+}
+
 def block_to_html_node(block):
     """Convert a single block to an HTMLNode based on its type."""
-    block_type = block_to_block_type(block)
-    if block_type == BlockType.PARAGRAPH:
-        return paragraph_to_html_node(block)
-    elif block_type == BlockType.HEADING:
-        return heading_to_html_node(block)
-    elif block_type == BlockType.CODE:
-        return code_to_html_node(block)
-    elif block_type == BlockType.QUOTE:
-        return quote_to_html_node(block)
-    elif block_type == BlockType.UNORDERED_LIST:
-        return unordered_list_to_html_node(block)
-    elif block_type == BlockType.ORDERED_LIST:
-        return ordered_list_to_html_node(block)
-    else:
-        raise ValueError(f"Unknown block type: {block_type}")
+    # Split once and share the lines between detection and conversion
+    lines = block.split("\n")
+    return _BLOCK_CONVERTERS[block_to_block_type(block, lines)](block, lines)
 
 def markdown_to_html_node(markdown):
     """Convert a full markdown document to a single parent HTMLNode."""
@@ -143,3 +164,82 @@ def markdown_to_html_node(markdown):
         html_node = block_to_html_node(block)
         block_nodes.append(html_node)
     return ParentNode("div", block_nodes)
+
+def text_to_html_str(text):
+    return "".join(map(text_node_to_html_str, text_to_textnodes(text)))
+
+def paragraph_to_html_str(block, lines=None):
+    if lines is None:
+        lines = block.split("\n")
+    return f"<p>{text_to_html_str(' '.join(lines))}</p>"
+
+def heading_to_html_str(block, lines=None):
+    level = len(block) - len(block.lstrip("#"))
+    return f"<h{level}>{text_to_html_str(block[level + 1:])}</h{level}>"
+
+def code_to_html_str(block, lines=None):
+    if lines is None:
+        lines = block.split("\n")
+    code_text = "\n".join(lines[1:-1])
+    if code_text:
+        code_text += "\n"
+    return f"<pre><code>{code_text}</code></pre>"
+
+def quote_to_html_str(block, lines=None):
+    if lines is None:
+        lines = block.split("\n")
+    stripped_lines = []
+    for line in lines:
+        if line.startswith(">"):
+            stripped_lines.append(line[1:].lstrip())
+        else:
+            stripped_lines.append(line)
+    return f"<blockquote>{text_to_html_str(' '.join(stripped_lines))}</blockquote>"
+
+def unordered_list_to_html_str(block, lines=None):
+    if lines is None:
+        lines = block.split("\n")
+    items = "".join(f"<li>{text_to_html_str(line[2:])}</li>" for line in lines)
+    return f"<ul>{items}</ul>"
+
+def ordered_list_to_html_str(block, lines=None):
+    if lines is None:
+        lines = block.split("\n")
+    items = "".join(
+        f"<li>{text_to_html_str(line.partition('. ')[2])}</li>" for line in lines
+    )
+    return f"<ol>{items}</ol>"
+
+_BLOCK_RENDERERS = {
+    BlockType.PARAGRAPH: paragraph_to_html_str,
+    BlockType.HEADING: heading_to_html_str,
+    BlockType.CODE: code_to_html_str,
+    BlockType.QUOTE: quote_to_html_str,
+    BlockType.UNORDERED_LIST: unordered_list_to_html_str,
+    BlockType.ORDERED_LIST: ordered_list_to_html_str,
+}
+
+def iter_markdown_html(markdown):
+    """
+    Yield the HTML for a markdown document one fragment at a time.
+
+    The fragments are the opening <div>, one string per block and the
+    closing </div>, so callers can write each block out as soon as it is
+    rendered.
+    """
+    yield "<div>"
+    for block in markdown_to_blocks(markdown):
+        lines = block.split("\n")
+        yield _BLOCK_RENDERERS[block_to_block_type(block, lines)](block, lines)
+    yield "</div>"
+
+def render_markdown(markdown):
+    """
+    Render a full markdown document straight to an HTML string.
+
+    Produces the same output as markdown_to_html_node(markdown).to_html(),
+    but the *_to_html_str converters emit HTML directly, so no LeafNode or
+    ParentNode objects are created. The node API is kept for callers that
+    want to inspect or build the tree.
+    """
+    return "".join(iter_markdown_html(markdown))
@@ -0,0 +1,28 @@
+import pytest
+
+from textnode import TextNode, TextType
+
+
+# Built once per test session and shared by reference; tests must not mutate them
+@pytest.fixture(scope="session")
+def full_markdown_text():
+    return (
+        "This is **text** with an _italic_ word and a `code block` and an "
+        "![obi wan image](https://i.imgur.com/fJRm4Vk.jpeg) and a [link](https://boot.dev)"
+    )
+
+
+@pytest.fixture(scope="session")
+def full_markdown_expected():
+    return [
+        TextNode("This is ", TextType.TEXT),
+        TextNode("text", TextType.BOLD),
+        TextNode(" with an ", TextType.TEXT),
+        TextNode("italic", TextType.ITALIC),
+        TextNode(" word and a ", TextType.TEXT),
+        TextNode("code block", TextType.CODE),
+        TextNode(" and an ", TextType.TEXT),
+        TextNode("obi wan image", TextType.IMAGE, "https://i.imgur.com/fJRm4Vk.jpeg"),
+        TextNode(" and a ", TextType.TEXT),
+        TextNode("link", TextType.LINK, "https://boot.dev"),
+    ]
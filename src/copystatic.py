@@ -1,27 +1,55 @@
+import contextlib
 import os
 import shutil
 
-def copy_files_recursive(source_dir, dest_dir):
-    if os.path.exists(dest_dir):
+def copy_files_recursive(source_dir, dest_dir, verbose=False, clean=True):
+    """
+    Copy source_dir into dest_dir and return the destination file paths.
+
+    With clean=True, dest_dir is deleted first. With clean=False, files
+    already in dest_dir are kept, so outputs from an earlier build survive;
+    pair this with remove_stale_files to drop whatever the build no longer
+    produces.
+    """
+    if clean and os.path.exists(dest_dir):
         print(f"Deleting existing directory: {dest_dir}")
         shutil.rmtree(dest_dir)
 
-    print(f"Creating directory: {dest_dir}")
-    os.mkdir(dest_dir)
-
-    _copy_contents(source_dir, dest_dir)
-
-def _copy_contents(source_dir, dest_dir):
-    items = os.listdir(source_dir)
+    print(f"Copying {source_dir} -> {dest_dir}")
 
-    for item in items:
-        source_path = os.path.join(source_dir, item)
-        dest_path = os.path.join(dest_dir, item)
+    copied = []
 
-        if os.path.isfile(source_path):
+    def copy_file(source_path, dest_path):
+        if verbose:
             print(f"Copying file: {source_path} -> {dest_path}")
+        copied.append(dest_path)
+        with contextlib.suppress(FileNotFoundError):
+            if os.path.samefile(source_path, dest_path):
+                # Already linked by an earlier build
+                return
+            os.remove(dest_path)
+        # Hardlink when possible to skip the byte copy; fall back to a real
+        # copy when the link fails (e.g. source and dest on different devices)
+        try:
+            os.link(source_path, dest_path)
+        except OSError:
             shutil.copy(source_path, dest_path)
-        else:
-            print(f"Creating directory: {dest_path}")
-            os.mkdir(dest_path)
-            _copy_contents(source_path, dest_path)
+
+    # copytree walks the tree with os.scandir, which avoids a stat() per entry
+    shutil.copytree(source_dir, dest_dir, copy_function=copy_file, dirs_exist_ok=True)
+    return copied
+
+def remove_stale_files(dest_dir, keep_paths):
+    """
+    Delete files under dest_dir that are not in keep_paths, then any
+    directories left empty.
+    """
+    keep = {os.path.normpath(path) for path in keep_paths}
+    for dir_path, dir_names, file_names in os.walk(dest_dir, topdown=False):
+        for file_name in file_names:
+            path = os.path.join(dir_path, file_name)
+            if os.path.normpath(path) not in keep:
+                print(f"Removing stale file: {path}")
+                os.remove(path)
+        if dir_path != dest_dir and not os.listdir(dir_path):
+            os.rmdir(dir_path)
@@ -5,13 +5,35 @@ This module handles converting markdown files to HTML pages by:
 1. Reading markdown content
 2. Converting to HTML via markdown parser
 3. Applying HTML template
-4. Formatting output with BeautifulSoup
+4. Optionally formatting output with BeautifulSoup
 5. Writing to destination file
 """
+import asyncio
+import contextlib
+import hashlib
+import json
+import multiprocessing
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from bs4 import BeautifulSoup
-from block_markdown import markdown_to_html_node
+from block_markdown import iter_markdown_html, render_markdown
+
+# (mtime_ns, (literal_segments, encoded_literal_segments, placeholder_order))
+# keyed by path, so each template is read, split and encoded once per
+# process, and again only if it changes. Literal segment i is followed by
+# placeholder i; there is always one more literal than placeholders.
+_TEMPLATE_CACHE = {}
+
+_PLACEHOLDER_RE = re.compile(r"\{\{ (Title|Content|BasePath) \}\}")
+
+# Pages handed to each pool task; a task prefetches its sources on threads
+_BATCH_SIZE = 8
+
+# Threads in generate_page_recursive_async's I/O pool, which bounds how many
+# blocking I/O operations are in flight at once
+_IO_CONCURRENCY = 64
 
 
 def extract_title(markdown):
@@ -36,16 +58,30 @@ def extract_title(markdown):
             return line[2:].strip()
     raise Exception("No h1 header found in markdown")
 
-def generate_page(from_path, template_path, dest_path, basepath="/"):
+def _split_template(template):
+    parts = _PLACEHOLDER_RE.split(template)
+    literals = parts[0::2]
+    return literals, [literal.encode("utf-8") for literal in literals], parts[1::2]
+
+def _load_template(template_path):
+    mtime_ns = os.stat(template_path).st_mtime_ns
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is None or cached[0] != mtime_ns:
+        with open(template_path, "r") as f:
+            cached = (mtime_ns, _split_template(f.read()))
+        _TEMPLATE_CACHE[template_path] = cached
+    return cached[1]
+
+def generate_page(from_path, template_path, dest_path, basepath="/", pretty=False):
     """
     Generate an HTML page from a markdown file.
 
     This function orchestrates the entire page generation process:
     1. Reads the markdown source file
-    2. Reads the HTML template
+    2. Reads the HTML template (cached after the first read)
     3. Converts markdown to HTML
     4. Replaces template placeholders ({{ Title }}, {{ Content }}, {{ BasePath }})
-    5. Formats the HTML with BeautifulSoup for readability
+    5. Formats the HTML with BeautifulSoup for readability, if pretty is set
     6. Writes the result to the destination path
 
     Args:
@@ -54,6 +90,9 @@ def generate_page(from_path, template_path, dest_path, basepath="/"):
         dest_path: Path where generated HTML will be written
         basepath: Base URL path for the site (e.g., "/" or "/repo-name/")
                  Used in <base href="{{ BasePath }}"> tag for relative URL resolution
+        pretty: If True, run the page through BeautifulSoup's prettify().
+                Off by default because parsing the page again is the most
+                expensive step for small documents.
 
     Example:
         generate_page(
@@ -68,30 +107,182 @@ def generate_page(from_path, template_path, dest_path, basepath="/"):
     with open(from_path, "r") as f:
         markdown = f.read()
 
-    with open(template_path, "r") as f:
-        template = f.read()
+    dest_dir = os.path.dirname(dest_path)
+    if dest_dir:
+        os.makedirs(dest_dir, exist_ok=True)
+
+    _write_page(markdown, template_path, dest_path, basepath, pretty)
+
+def _iter_page(markdown, literals, placeholders, title, basepath):
+    """
+    Yield the pieces of a page in order: each literal template segment,
+    followed by the value of the placeholder after it. Literals are yielded
+    as given, so pass the encoded segments to stream bytes; placeholder
+    values are always str.
+
+    {{ BasePath }} is also substituted inside the title and the rendered
+    content, matching the old Title -> Content -> BasePath replace chain.
+    """
+    values = {
+        "Title": title.replace("{{ BasePath }}", basepath),
+        "BasePath": basepath,
+    }
+    if placeholders.count("Content") > 1:
+        # Render once rather than once per placeholder
+        values["Content"] = render_markdown(markdown).replace("{{ BasePath }}", basepath)
+
+    yield literals[0]
+    for placeholder, literal in zip(placeholders, literals[1:]):
+        if placeholder in values:
+            yield values[placeholder]
+        else:
+            for fragment in iter_markdown_html(markdown):
+                yield fragment.replace("{{ BasePath }}", basepath)
+        yield literal
+
+def _write_page(markdown, template_path, dest_path, basepath, pretty):
+    """Render a page to dest_path and return the sha256 of the written file."""
+    literals, encoded_literals, placeholders = _load_template(template_path)
 
-    html_node = markdown_to_html_node(markdown)
-    html_content = html_node.to_html()
+    if pretty:
+        # prettify() needs the whole page
+        page = _render_pretty_page(markdown, literals, placeholders, basepath)
+        return _write_pieces(dest_path, (page,))
 
     title = extract_title(markdown)
+    return _write_pieces(
+        dest_path, _iter_page(markdown, encoded_literals, placeholders, title, basepath)
+    )
 
-    page = template.replace("{{ Title }}", title)
-    page = page.replace("{{ Content }}", html_content)
-    page = page.replace("{{ BasePath }}", basepath)
+def _write_pieces(dest_path, pieces):
+    # Write to a temp file next to dest_path and move it into place, so a
+    # failed render never leaves a half-written page, and a page never
+    # writes through a hardlink into static/. Template literals arrive
+    # already encoded; only the per-page values are encoded here. The same
+    # bytes are written and hashed, so the digest matches the file without
+    # reading it back.
+    digest = hashlib.sha256()
+    tmp_path = dest_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            for piece in pieces:
+                data = piece if type(piece) is bytes else piece.encode("utf-8")
+                digest.update(data)
+                f.write(data)
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return digest.hexdigest()
+
+def _render_pretty_page(markdown, literals, placeholders, basepath):
+    title = extract_title(markdown)
+
+    # One join over the pre-split template instead of a replace() pass
+    # (and a full copy of the page) per placeholder
+    page = "".join(_iter_page(markdown, literals, placeholders, title, basepath))
 
     # Format HTML with BeautifulSoup for better readability
     soup = BeautifulSoup(page, 'html.parser')
-    formatted_page = soup.prettify()
+    return soup.prettify()
 
-    dest_dir = os.path.dirname(dest_path)
-    if dest_dir:
-        os.makedirs(dest_dir, exist_ok=True)
+# Per-worker settings for generate_page_recursive, set up once by _init_worker
+_worker_template_path = None
+_worker_basepath = None
+_worker_pretty = False
+
+def _init_worker(template_path, basepath, pretty):
+    global _worker_template_path, _worker_basepath, _worker_pretty
+    _load_template(template_path)
+    _worker_template_path = template_path
+    _worker_basepath = basepath
+    _worker_pretty = pretty
+
+def _render_batch(batch):
+    """Render a batch of pages inside a pool worker, using its settings."""
+    return _render_pages(batch, _worker_template_path, _worker_basepath, _worker_pretty)
+
+def _render_pages(batch, template_path, basepath, pretty):
+    """
+    Render a batch of (markdown_path, html_path) pairs.
+
+    Each page is rendered and streamed to disk in turn, hashing its bytes
+    as they are written. A small thread pool prefetches the markdown
+    sources meanwhile, so reading the next pages overlaps with rendering.
+    Returns the sha256 of each written page, in batch order.
+    """
+    with ThreadPoolExecutor(max_workers=len(batch)) as io_pool:
+        sources = io_pool.map(_read_file, [from_path for from_path, _ in batch])
+        digests = []
+        for (from_path, dest_path), markdown in zip(batch, sources):
+            print(f"Generating page from {from_path} to {dest_path} using {template_path}")
+            digests.append(_write_page(markdown, template_path, dest_path, basepath, pretty))
+        return digests
+
+def _read_file(path):
+    with open(path, "r") as f:
+        return f.read()
+
+def _file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def _load_build_cache(cache_path):
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _save_build_cache(cache_path, cache):
+    with open(cache_path, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
 
-    with open(dest_path, "w") as f:
-        f.write(formatted_page)
+def _is_up_to_date(entry, fingerprint, dest_path):
+    """Check a cache entry against the current inputs and the file on disk."""
+    if entry is None or entry.get("fingerprint") != fingerprint:
+        return False
+    try:
+        return _file_sha256(dest_path) == entry.get("sha256")
+    except OSError:
+        return False
 
-def generate_page_recursive(dir_path_content, template_path, dest_dir_path, basepath):
+def _collect_pages(dir_path_content, dest_dir_path, pairs=None):
+    """
+    Walk the content tree and return (markdown_path, html_path) pairs.
+
+    Destination directories are created here, in the calling process, so
+    that pool workers never race each other on os.makedirs. Entries come
+    from os.scandir, whose DirEntry caches the file type from the directory
+    read instead of costing a stat() per entry.
+    """
+    if pairs is None:
+        pairs = []
+
+    with os.scandir(dir_path_content) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    created_dest_dir = False
+    for entry in entries:
+        dest_path = os.path.join(dest_dir_path, entry.name)
+        if entry.is_file():
+            # Only process markdown files
+            if entry.name.endswith(".md"):
+                if not created_dest_dir:
+                    os.makedirs(dest_dir_path, exist_ok=True)
+                    created_dest_dir = True
+                # Change .md extension to .html
+                pairs.append((entry.path, dest_path[:-3] + ".html"))
+        else:
+            # Recurse into subdirectories
+            _collect_pages(entry.path, dest_path, pairs)
+    return pairs
+
+def generate_page_recursive(
+    dir_path_content, template_path, dest_dir_path, basepath, pretty=False, cache_path=None
+):
     """
     Recursively generate HTML pages from a directory tree of markdown files.
 
@@ -100,6 +291,21 @@ def generate_page_recursive(dir_path_content, template_path, dest_dir_path, base
     - Preserves the directory structure in the output
     - Recursively processes subdirectories
 
+    Pages are independent of each other, so they are rendered in parallel
+    with a ProcessPoolExecutor; each worker loads the template once, and
+    while it renders and writes pages one after another, a small thread
+    pool prefetches the markdown sources of the rest of its batch.
+    When no more than _BATCH_SIZE pages need rendering, they are rendered
+    in this process instead, since the pool would only start one worker.
+
+    This is a synchronous wrapper around generate_page_recursive_async.
+
+    Builds are incremental when cache_path is given: that JSON file records,
+    per source file, the source and template mtimes, the render settings and
+    the sha256 of the generated HTML. A page is skipped when none of those
+    have changed and the output file still matches the recorded hash. Keep
+    the cache outside dest_dir_path so it isn't deployed with the site.
+
     This allows you to organize content in nested directories (e.g., blog/posts/2024/)
     and the same structure will be maintained in the generated site.
 
@@ -108,6 +314,12 @@ def generate_page_recursive(dir_path_content, template_path, dest_dir_path, base
         template_path: Path to HTML template (same template used for all pages)
         dest_dir_path: Root directory where HTML files will be written
         basepath: Base URL path passed to all generated pages
+        pretty: Passed through to generate_page (off by default)
+        cache_path: Path of the incremental build cache, or None to
+                    regenerate every page
+
+    Returns:
+        The paths of all generated pages, including skipped unchanged ones
 
     Example:
         generate_page_recursive(
@@ -117,16 +329,102 @@ def generate_page_recursive(dir_path_content, template_path, dest_dir_path, base
             "/"
         )
     """
-    for filename in os.listdir(dir_path_content):
-        from_path = os.path.join(dir_path_content, filename)
-        dest_path = os.path.join(dest_dir_path, filename)
+    return asyncio.run(generate_page_recursive_async(
+        dir_path_content, template_path, dest_dir_path, basepath, pretty, cache_path
+    ))
 
-        if os.path.isfile(from_path):
-            # Only process markdown files
-            if from_path.endswith(".md"):
-                # Change .md extension to .html
-                dest_path = dest_path[:-3] + ".html"
-                generate_page(from_path, template_path, dest_path, basepath)
+async def generate_page_recursive_async(
+    dir_path_content, template_path, dest_dir_path, basepath, pretty=False, cache_path=None
+):
+    """
+    Async implementation of generate_page_recursive.
+
+    Blocking I/O runs on a dedicated pool of _IO_CONCURRENCY threads, so
+    that many operations are in flight at once: walking the content tree,
+    checking the build cache against mtimes and existing output hashes,
+    and saving the cache. Rendering stays synchronous, either in the
+    process pool, whose batches the loop awaits together, or, for builds
+    of a single batch, on one of those threads.
+
+    Args:
+        Same as generate_page_recursive.
+    """
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=_IO_CONCURRENCY) as io_pool:
+        def run_io(func, *args):
+            return loop.run_in_executor(io_pool, func, *args)
+
+        pairs = await run_io(_collect_pages, dir_path_content, dest_dir_path)
+        if not pairs:
+            return []
+
+        old_cache = {}
+        if cache_path is not None:
+            old_cache = await run_io(_load_build_cache, cache_path)
+        template_mtime_ns = (await run_io(os.stat, template_path)).st_mtime_ns
+
+        checks = await asyncio.gather(*(
+            run_io(
+                _check_page,
+                from_path, dest_path, old_cache.get(from_path), template_mtime_ns, basepath, pretty,
+            )
+            for from_path, dest_path in pairs
+        ))
+
+        new_cache = {}
+        stale_pairs = []
+        stale_fingerprints = []
+        for (from_path, dest_path), (fingerprint, up_to_date) in zip(pairs, checks):
+            if up_to_date:
+                new_cache[from_path] = old_cache[from_path]
+            else:
+                stale_pairs.append((from_path, dest_path))
+                stale_fingerprints.append(fingerprint)
+
+        if not stale_pairs:
+            digests = []
+        elif len(stale_pairs) <= _BATCH_SIZE:
+            # One batch would only ever occupy one pool worker, so the pool's
+            # start-up cost buys no parallelism; render in this process instead
+            digests = await run_io(_render_pages, stale_pairs, template_path, basepath, pretty)
         else:
-            # Recurse into subdirectories
-            generate_page_recursive(from_path, template_path, dest_path, basepath)
+            batches = [
+                stale_pairs[i:i + _BATCH_SIZE]
+                for i in range(0, len(stale_pairs), _BATCH_SIZE)
+            ]
+            # Pages are independent and CPU-bound, so render them across processes
+            with ProcessPoolExecutor(
+                mp_context=_pool_context(),
+                initializer=_init_worker,
+                initargs=(template_path, basepath, pretty),
+            ) as executor:
+                batch_digests = await asyncio.gather(*(
+                    loop.run_in_executor(executor, _render_batch, batch)
+                    for batch in batches
+                ))
+            digests = [digest for batch in batch_digests for digest in batch]
+
+        for (from_path, _), fingerprint, digest in zip(stale_pairs, stale_fingerprints, digests):
+            new_cache[from_path] = {"fingerprint": fingerprint, "sha256": digest}
+
+        if cache_path is not None:
+            await run_io(_save_build_cache, cache_path, new_cache)
+    return [dest_path for _, dest_path in pairs]
+
+def _pool_context():
+    # The I/O pool's threads are already running when the process pool
+    # starts, and forking a multi-threaded process can deadlock the child.
+    # Prefer a forkserver where the platform has one.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+def _check_page(from_path, dest_path, entry, template_mtime_ns, basepath, pretty):
+    """Return the page's current fingerprint and whether its output is up to date."""
+    fingerprint = [
+        os.stat(from_path).st_mtime_ns,
+        template_mtime_ns,
+        basepath,
+        pretty,
+    ]
+    return fingerprint, _is_up_to_date(entry, fingerprint, dest_path)
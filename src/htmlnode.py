@@ -2,6 +2,8 @@ from textnode import TextType
 
 
 class HTMLNode:
+    __slots__ = ("tag", "value", "children", "props")
+
     def __init__(self, tag=None, value=None, children=None, props=None):
         self.tag = tag
         self.value = value
@@ -12,17 +14,17 @@ class HTMLNode:
         raise NotImplementedError("to_html method not implemented")
 
     def props_to_html(self):
-        if self.props is None or len(self.props) == 0:
+        props = self.props
+        if not props:
             return ""
-        result = ""
-        for key, value in self.props.items():
-            result += f' {key}="{value}"'
-        return result
+        return "".join([f' {key}="{value}"' for key, value in props.items()])
 
     def __repr__(self):
         return f"HTMLNode({self.tag}, {self.value}, {self.children}, {self.props})"
 
 class LeafNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, value, props=None):
         super().__init__(tag, value, None, props)
 
@@ -37,36 +39,52 @@ class LeafNode(HTMLNode):
         return f"LeafNode({self.tag}, {self.value}, {self.props})"
 
 class ParentNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, children, props=None):
         super().__init__(tag, None, children, props)
 
     def to_html(self):
-        if self.tag is None:
-            raise ValueError("ParentNode must have a tag")
-        if self.children is None:
-            raise ValueError("ParentNode must have a children")
+        # Walk the tree with an explicit stack instead of recursing, and join
+        # the pieces once at the end instead of concatenating at every level.
+        # Closing tags are pushed as 1-tuples so they pop after the children.
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if type(node) is tuple:
+                parts.append(node[0])
+                continue
+            if node is not self and type(node) is not ParentNode:
+                # Leaves, and subclasses that may override to_html
+                parts.append(node.to_html())
+                continue
+
+            if node.tag is None:
+                raise ValueError("ParentNode must have a tag")
+            if node.children is None:
+                raise ValueError("ParentNode must have a children")
 
-        children_html = ""
-        for child in self.children:
-            children_html += child.to_html()
+            parts.append(f"<{node.tag}{node.props_to_html()}>")
+            stack.append((f"</{node.tag}>",))
+            stack.extend(reversed(node.children))
 
-        return f"<{self.tag}{self.props_to_html()}>{children_html}</{self.tag}>"
+        return "".join(parts)
 
     def __repr__(self):
         return f"ParentNode({self.tag}, {self.children}, {self.props})"
 
+_TEXT_TYPE_TO_HTML = {
+    TextType.TEXT: lambda text_node: LeafNode(None, text_node.text),
+    TextType.BOLD: lambda text_node: LeafNode("b", text_node.text),
+    TextType.ITALIC: lambda text_node: LeafNode("i", text_node.text),
+    TextType.CODE: lambda text_node: LeafNode("code", text_node.text),
+    TextType.LINK: lambda text_node: LeafNode("a", text_node.text, {"href": text_node.url}),
+    TextType.IMAGE: lambda text_node: LeafNode("img", "", {"src": text_node.url, "alt": text_node.text}),
+}
+
 def text_node_to_html_node(text_node):
-    if text_node.text_type == TextType.TEXT:
-        return LeafNode(None, text_node.text)
-    elif text_node.text_type == TextType.BOLD:
-        return LeafNode("b", text_node.text)
-    elif text_node.text_type == TextType.ITALIC:
-        return LeafNode("i", text_node.text)
-    elif text_node.text_type == TextType.CODE:
-        return LeafNode("code", text_node.text)
-    elif text_node.text_type == TextType.LINK:
-        return LeafNode("a", text_node.text, {"href": text_node.url})
-    elif text_node.text_type == TextType.IMAGE:
-        return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
-    else:
+    converter = _TEXT_TYPE_TO_HTML.get(text_node.text_type)
+    if converter is None:
         raise ValueError(f"Unknown text type: {text_node.text_type}")
+    return converter(text_node)
@@ -1,46 +1,74 @@
 import re
 from typing import Text
 
+from htmlnode import text_node_to_html_node  # re-exported for existing callers
 from textnode import TextNode, TextType
 
+_IMAGE_RE = re.compile(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)")
+_LINK_RE = re.compile(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+# Delimiter pairs, a lone (unclosed) delimiter, then images and links. The
+# regex engine finds each closing delimiter, so one finditer pass yields
+# every inline token in order.
+_INLINE_RE = re.compile(
+    r"\*\*(.*?)\*\*|_(.*?)_|`(.*?)`"
+    r"|(\*\*|_|`)"
+    r"|!\[([^\[\]]*)\]\(([^\(\)]*)\)"
+    r"|\[([^\[\]]*)\]\(([^\(\)]*)\)",
+    re.DOTALL,
+)
+# TextType for each delimiter group, indexed by match.lastindex
+_DELIMITER_TYPES = (None, TextType.BOLD, TextType.ITALIC, TextType.CODE)
+# Compiled "<delimiter>(.*?)<delimiter>" patterns for split_nodes_delimiter
+_DELIMITER_PATTERNS = {}
+
 
 def split_nodes_delimiter(old_nodes, delimiter, text_type):
     new_nodes = []
+    pattern = _delimiter_pattern(delimiter)
+    # Enum members are singletons: look TEXT up once and compare by identity
+    plain_text = TextType.TEXT
     for old_node in old_nodes:
-        if old_node.text_type != TextType.TEXT:
+        if old_node.text_type is not plain_text:
             new_nodes.append(old_node)
             continue
 
-        split_nodes = []
-        sections = old_node.text.split(delimiter)
-        
-        if len(sections) % 2 == 0:
+        # Only slice out the delimited pairs and the text between them,
+        # rather than splitting the whole string on every delimiter
+        text = old_node.text
+        pos = 0
+        for match in pattern.finditer(text):
+            if match.start() > pos:
+                new_nodes.append(TextNode(text[pos:match.start()], plain_text))
+            if match.group(1):
+                new_nodes.append(TextNode(match.group(1), text_type))
+            pos = match.end()
+
+        if delimiter in text[pos:]:
             raise ValueError(f"Invalid markdown: no closing delimiter '{delimiter}' found")
-
-        for i in range(len(sections)):
-            if sections[i] == "":
-                continue
-            if i % 2 == 0:
-                split_nodes.append(TextNode(sections[i], TextType.TEXT))
-            else:
-                split_nodes.append(TextNode(sections[i], text_type))
-
-        new_nodes.extend(split_nodes)
+        if pos < len(text):
+            new_nodes.append(TextNode(text[pos:], plain_text))
 
     return new_nodes
 
+def _delimiter_pattern(delimiter):
+    pattern = _DELIMITER_PATTERNS.get(delimiter)
+    if pattern is None:
+        escaped = re.escape(delimiter)
+        pattern = re.compile(escaped + r"(.*?)" + escaped, re.DOTALL)
+        _DELIMITER_PATTERNS[delimiter] = pattern
+    return pattern
+
 def extract_markdown_images(text):
-    pattern = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
-    return re.findall(pattern, text)
+    return _IMAGE_RE.findall(text)
 
 def extract_markdown_links(text):
-    pattern = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
-    return re.findall(pattern, text)
+    return _LINK_RE.findall(text)
 
 def split_nodes_image(old_nodes):
     new_nodes = []
+    plain_text = TextType.TEXT
     for node in old_nodes:
-        if node.text_type != TextType.TEXT:
+        if node.text_type is not plain_text:
             new_nodes.append(node)
             continue
 
@@ -55,21 +83,22 @@ def split_nodes_image(old_nodes):
             sections = remaining_text.split(f"![{image_alt}]({image_url})", 1)
 
             if sections[0]:
-                new_nodes.append(TextNode(sections[0], TextType.TEXT))
+                new_nodes.append(TextNode(sections[0], plain_text))
             
             new_nodes.append(TextNode(image_alt, TextType.IMAGE, image_url))
 
             remaining_text = sections[1] if len(sections) > 1 else ""
 
         if remaining_text:
-            new_nodes.append(TextNode(remaining_text, TextType.TEXT))
+            new_nodes.append(TextNode(remaining_text, plain_text))
     
     return new_nodes
 
 def split_nodes_link(old_nodes):
     new_nodes = []
+    plain_text = TextType.TEXT
     for node in old_nodes:
-        if node.text_type != TextType.TEXT:
+        if node.text_type is not plain_text:
             new_nodes.append(node)
             continue
 
@@ -84,40 +113,60 @@ def split_nodes_link(old_nodes):
             sections = remaining_text.split(f"[{link_text}]({link_url})", 1)
 
             if sections[0]:
-                new_nodes.append(TextNode(sections[0], TextType.TEXT))
+                new_nodes.append(TextNode(sections[0], plain_text))
 
             new_nodes.append(TextNode(link_text, TextType.LINK, link_url))
 
             remaining_text = sections[1] if len(sections) > 1 else ""
 
         if remaining_text:
-            new_nodes.append(TextNode(remaining_text, TextType.TEXT))
+            new_nodes.append(TextNode(remaining_text, plain_text))
 
     return new_nodes
 
-def text_to_textnodes(text):
-    nodes = [TextNode(text, TextType.TEXT)]
-    nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD)
-    nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC)
-    nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
-    nodes = split_nodes_image(nodes)
-    nodes = split_nodes_link(nodes)
+def _tokenize(text):
+    # Single left-to-right scan: delimiters consume everything up to their
+    # closing delimiter as literal text, images and links are emitted whole.
+    nodes = []
+    plain_text = TextType.TEXT
+    pos = 0
+    for match in _INLINE_RE.finditer(text):
+        start = match.start()
+        if start > pos:
+            nodes.append(TextNode(text[pos:start], plain_text))
+        pos = match.end()
+
+        group = match.lastindex
+        if group <= 3:
+            inner = match.group(group)
+            if inner:
+                nodes.append(TextNode(inner, _DELIMITER_TYPES[group]))
+        elif group == 4:
+            raise ValueError(f"Invalid markdown: no closing delimiter '{match.group(4)}' found")
+        elif group == 6:
+            nodes.append(TextNode(match.group(5), TextType.IMAGE, match.group(6)))
+        else:
+            nodes.append(TextNode(match.group(7), TextType.LINK, match.group(8)))
+
+    if pos < len(text):
+        nodes.append(TextNode(text[pos:], plain_text))
     return nodes
 
-def text_node_to_html_node(text_node):
-    if text_node.text_type == TextType.TEXT:
-        return LeafNode(None, text_node.text)
-    elif text_node.text_type == TextType.BOLD:
-        return LeafNode("b", text_node.text)
-    elif text_node.text_type == TextType.ITALIC:
-        return LeafNode("i", text_node.text)
-    elif text_node.text_type == TextType.CODE:
-        return LeafNode("code", text_node.text)
-    elif text_node.text_type == TextType.LINK:
-        return LeafNode("a", text_node.text, {"href": text_node.url})
-    elif text_node.text_type == TextType.IMAGE:
-        return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
-    else:
-        raise ValueError(f"Invalid text type: {text_node.text_type}")
-
-from htmlnode import LeafNode
+def text_to_textnodes(text):
+    return _tokenize(text)
+
+_TEXT_NODE_HTML = {
+    TextType.TEXT: lambda text_node: text_node.text,
+    TextType.BOLD: lambda text_node: f"<b>{text_node.text}</b>",
+    TextType.ITALIC: lambda text_node: f"<i>{text_node.text}</i>",
+    TextType.CODE: lambda text_node: f"<code>{text_node.text}</code>",
+    TextType.LINK: lambda text_node: f'<a href="{text_node.url}">{text_node.text}</a>',
+    TextType.IMAGE: lambda text_node: f'<img src="{text_node.url}" alt="{text_node.text}"></img>',
+}
+
+def text_node_to_html_str(text_node):
+    # Same HTML as text_node_to_html_node(text_node).to_html(), minus the LeafNode
+    renderer = _TEXT_NODE_HTML.get(text_node.text_type)
+    if renderer is None:
+        raise ValueError(f"Unknown text type: {text_node.text_type}")
+    return renderer(text_node)
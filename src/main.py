@@ -3,8 +3,9 @@ Static site generator main entry point.
 
 This script orchestrates the entire site generation process:
 1. Copy static assets (CSS, images) to public directory
-2. Convert all markdown files to HTML pages
+2. Convert all markdown files to HTML pages, skipping unchanged ones
 3. Apply template and base path configuration
+4. Remove files left in public by earlier builds
 
 Usage:
     python src/main.py [basepath]
@@ -22,16 +23,18 @@ Examples:
     # GitHub Pages deployment
     python src/main.py /static-site-generator/
 """
+import asyncio
 import sys
 
-from copystatic import copy_files_recursive
-from generate_page import generate_page_recursive
+from copystatic import copy_files_recursive, remove_stale_files
+from generate_page import generate_page_recursive_async
 
 # Directory paths - modify these if you change project structure
 dir_path_static = "./static"      # Static assets (CSS, images)
 dir_path_public = "./public"      # Generated site output
 dir_path_content = "./content"    # Markdown source files
 template_path = "./template.html" # HTML template
+build_cache_path = "./.build_cache.json"  # Incremental build state, kept out of public
 
 
 def main():
@@ -42,6 +45,7 @@ def main():
     1. Parse command line arguments for basepath
     2. Copy all static files to public directory
     3. Recursively generate HTML pages from markdown files
+    4. Delete anything in public that neither step produced
     """
     # Default to root path
     basepath = "/"
@@ -51,12 +55,18 @@ def main():
         basepath = sys.argv[1]
 
     # Step 1: Copy static assets (CSS, images, etc.)
-    # This deletes and recreates the public directory
-    copy_files_recursive(dir_path_static, dir_path_public)
+    # The public directory is kept so unchanged pages needn't be regenerated
+    static_paths = copy_files_recursive(dir_path_static, dir_path_public, clean=False)
 
     # Step 2: Generate HTML pages from markdown
     # Processes all .md files in content directory recursively
-    generate_page_recursive(dir_path_content, template_path, dir_path_public, basepath)
+    page_paths = asyncio.run(generate_page_recursive_async(
+        dir_path_content, template_path, dir_path_public, basepath,
+        cache_path=build_cache_path,
+    ))
+
+    # Step 3: Drop outputs whose static file or markdown source is gone
+    remove_stale_files(dir_path_public, static_paths + page_paths)
 
 
 if __name__ == "__main__":
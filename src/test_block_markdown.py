@@ -1,7 +1,7 @@
 import unittest
 
 from block_markdown import (BlockType, block_to_block_type, markdown_to_blocks,
-                            markdown_to_html_node)
+                            markdown_to_html_node, render_markdown)
 
 
 class TestMarkdownToBlocks(unittest.TestCase):
@@ -45,6 +45,13 @@ Second block
         blocks = markdown_to_blocks(md)
         self.assertEqual(blocks, ["Block with spaces", "Another block"])
 
+    def test_markdown_to_blocks_code_with_whitespace_only_line(self):
+        md = "```\ndef f():\n    x = 1\n    \n    return x\n```"
+        self.assertEqual(markdown_to_blocks(md), [md])
+        html = "<div><pre><code>def f():\n    x = 1\n    \n    return x\n</code></pre></div>"
+        self.assertEqual(markdown_to_html_node(md).to_html(), html)
+        self.assertEqual(render_markdown(md), html)
+
 
 class TestBlockToBlockType(unittest.TestCase):
     def test_heading_h1(self):
@@ -231,5 +238,39 @@ some code
         )
 
 
+class TestRenderMarkdown(unittest.TestCase):
+    def test_matches_node_tree_output(self):
+        md = """
+# Title with **bold**
+
+This is a paragraph with _italic_, `code`, a [link](https://example.com)
+and an ![image](https://img.com/pic.png).
+
+- List item 1
+- List item 2
+
+1. First
+2. Second
+
+>A quote
+>over two lines
+
+```
+some **code**
+```
+"""
+        self.assertEqual(render_markdown(md), markdown_to_html_node(md).to_html())
+
+    def test_paragraph(self):
+        md = "This is **bolded** paragraph"
+        self.assertEqual(
+            render_markdown(md),
+            "<div><p>This is <b>bolded</b> paragraph</p></div>",
+        )
+
+    def test_empty_document(self):
+        self.assertEqual(render_markdown(""), "<div></div>")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,127 @@
+import os
+import shutil
+
+import copystatic
+from copystatic import copy_files_recursive, remove_stale_files
+from generate_page import generate_page_recursive
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_copy_files_recursive_returns_copied_paths(tmp_path):
+    source = tmp_path / "static"
+    dest = tmp_path / "public"
+    _write(source / "index.css", "body {}")
+    _write(source / "images" / "logo.svg", "<svg></svg>")
+
+    copied = copy_files_recursive(str(source), str(dest))
+
+    assert sorted(copied) == sorted([
+        str(dest / "index.css"),
+        str(dest / "images" / "logo.svg"),
+    ])
+    assert _read(dest / "images" / "logo.svg") == "<svg></svg>"
+
+
+def test_copy_files_recursive_clean_removes_old_files(tmp_path):
+    source = tmp_path / "static"
+    dest = tmp_path / "public"
+    _write(source / "index.css", "body {}")
+    _write(dest / "old.html", "old")
+
+    copy_files_recursive(str(source), str(dest))
+
+    assert not (dest / "old.html").exists()
+
+
+def test_copy_files_recursive_without_clean_keeps_and_updates(tmp_path):
+    source = tmp_path / "static"
+    dest = tmp_path / "public"
+    _write(source / "index.css", "body {}")
+    copy_files_recursive(str(source), str(dest), clean=False)
+    _write(dest / "index.html", "page")
+
+    # Replace the source file rather than editing it, so it is no longer
+    # the same file as the earlier copy
+    os.remove(source / "index.css")
+    _write(source / "index.css", "body { margin: 0 }")
+    copy_files_recursive(str(source), str(dest), clean=False)
+
+    assert _read(dest / "index.html") == "page"
+    assert _read(dest / "index.css") == "body { margin: 0 }"
+
+
+def test_copy_files_recursive_falls_back_to_copy(tmp_path, monkeypatch):
+    source = tmp_path / "static"
+    dest = tmp_path / "public"
+    _write(source / "index.css", "body {}")
+
+    def fail_link(source_path, dest_path):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(copystatic.os, "link", fail_link)
+    copy_files_recursive(str(source), str(dest))
+
+    assert _read(dest / "index.css") == "body {}"
+    assert not os.path.samefile(source / "index.css", dest / "index.css")
+
+
+def test_copy_files_recursive_skips_already_linked_files(tmp_path, monkeypatch):
+    source = tmp_path / "static"
+    dest = tmp_path / "public"
+    _write(source / "index.css", "body {}")
+    copy_files_recursive(str(source), str(dest), clean=False)
+    if not os.path.samefile(source / "index.css", dest / "index.css"):
+        # Filesystem without hardlinks; nothing to skip
+        return
+
+    def fail(*args):
+        raise AssertionError("linked file was copied again")
+
+    monkeypatch.setattr(copystatic.os, "link", fail)
+    monkeypatch.setattr(copystatic.os, "remove", fail)
+    monkeypatch.setattr(shutil, "copy", fail)
+    copied = copy_files_recursive(str(source), str(dest), clean=False)
+
+    assert copied == [str(dest / "index.css")]
+    assert os.path.samefile(source / "index.css", dest / "index.css")
+
+
+def test_generated_page_does_not_overwrite_static_file(tmp_path):
+    # A static file and a page with the same output path: the page wins in
+    # public/, but must not write through the hardlink into static/
+    source = tmp_path / "static"
+    dest = tmp_path / "public"
+    content = tmp_path / "content"
+    template = tmp_path / "template.html"
+    _write(source / "index.html", "static page")
+    _write(content / "index.md", "# Title")
+    _write(template, "<title>{{ Title }}</title>{{ Content }}")
+
+    copy_files_recursive(str(source), str(dest), clean=False)
+    generate_page_recursive(str(content), str(template), str(dest), "/")
+
+    assert _read(source / "index.html") == "static page"
+    assert _read(dest / "index.html").startswith("<title>Title</title>")
+
+
+def test_remove_stale_files(tmp_path):
+    dest = tmp_path / "public"
+    _write(dest / "index.html", "page")
+    _write(dest / "blog" / "old" / "index.html", "removed page")
+    _write(dest / "images" / "logo.svg", "<svg></svg>")
+
+    remove_stale_files(str(dest), [str(dest / "index.html"), str(dest / "images" / "logo.svg")])
+
+    assert (dest / "index.html").exists()
+    assert (dest / "images" / "logo.svg").exists()
+    assert not (dest / "blog").exists()
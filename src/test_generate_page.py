@@ -1,5 +1,10 @@
+import asyncio
+import os
+import tempfile
 import unittest
-from generate_page import extract_title
+from generate_page import (extract_title, generate_page,
+                           generate_page_recursive,
+                           generate_page_recursive_async)
 
 
 class TestExtractTitle(unittest.TestCase):
@@ -49,5 +54,208 @@ Some content
             extract_title(md)
 
 
+class TestGeneratePage(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.source_path = os.path.join(self.tmp.name, "index.md")
+        self.template_path = os.path.join(self.tmp.name, "template.html")
+        self.dest_path = os.path.join(self.tmp.name, "public", "index.html")
+
+    def _generate(self, markdown, template, basepath):
+        for path, text in ((self.source_path, markdown), (self.template_path, template)):
+            with open(path, "w") as f:
+                f.write(text)
+        generate_page(self.source_path, self.template_path, self.dest_path, basepath)
+        with open(self.dest_path) as f:
+            return f.read()
+
+    def test_streams_full_page(self):
+        page = self._generate(
+            "# Hello\n\nSome **bold** text",
+            '<html><head><base href="{{ BasePath }}"><title>{{ Title }}</title></head>'
+            "<body>{{ Content }}</body></html>",
+            "/site/",
+        )
+        self.assertEqual(
+            page,
+            '<html><head><base href="/site/"><title>Hello</title></head><body>'
+            "<div><h1>Hello</h1><p>Some <b>bold</b> text</p></div></body></html>",
+        )
+
+    def test_basepath_substituted_in_content(self):
+        page = self._generate("# T\n\n[home]({{ BasePath }}index.html)", "{{ Content }}", "/b/")
+        self.assertEqual(page, '<div><h1>T</h1><p><a href="/b/index.html">home</a></p></div>')
+
+    def test_repeated_placeholders(self):
+        page = self._generate(
+            "# {{ BasePath }}t",
+            "{{ Title }}|{{ BasePath }}|{{ Content }}|{{ BasePath }}|{{ Title }}",
+            "/b/",
+        )
+        self.assertEqual(page, "/b/t|/b/|<div><h1>/b/t</h1></div>|/b/|/b/t")
+
+
+class TestGeneratePageRecursive(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = self.tmp.name
+
+        self.content_dir = os.path.join(root, "content")
+        self.dest_dir = os.path.join(root, "public")
+        self.cache_path = os.path.join(root, "build_cache.json")
+        os.makedirs(os.path.join(self.content_dir, "blog", "post"))
+        os.makedirs(os.path.join(self.content_dir, "empty"))
+
+        self._write(os.path.join(self.content_dir, "index.md"), "# Home\n\nWelcome **home**")
+        self._write(os.path.join(self.content_dir, "blog", "post", "index.md"), "# Post\n\nA post")
+        self._write(os.path.join(self.content_dir, "notes.txt"), "not markdown")
+
+        self.template_path = os.path.join(root, "template.html")
+        self._write(
+            self.template_path,
+            "<html><head><base href=\"{{ BasePath }}\"><title>{{ Title }}</title></head>"
+            "<body>{{ Content }}</body></html>",
+        )
+
+    def _write(self, path, text):
+        with open(path, "w") as f:
+            f.write(text)
+
+    def _read(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def _build(self, basepath="/"):
+        return generate_page_recursive(
+            self.content_dir, self.template_path, self.dest_dir, basepath,
+            cache_path=self.cache_path,
+        )
+
+    def test_generates_nested_pages(self):
+        generate_page_recursive(self.content_dir, self.template_path, self.dest_dir, "/site/")
+
+        index_html = self._read(os.path.join(self.dest_dir, "index.html"))
+        self.assertIn("<b>", index_html)
+        self.assertIn("home", index_html)
+        self.assertIn('href="/site/"', index_html)
+
+        post_html = self._read(os.path.join(self.dest_dir, "blog", "post", "index.html"))
+        self.assertIn("Post", post_html)
+
+    def test_async_entry_point(self):
+        asyncio.run(generate_page_recursive_async(
+            self.content_dir, self.template_path, self.dest_dir, "/"
+        ))
+        self.assertIn("Welcome", self._read(os.path.join(self.dest_dir, "index.html")))
+        self.assertIn("Post", self._read(os.path.join(self.dest_dir, "blog", "post", "index.html")))
+
+    def test_output_not_prettified_by_default(self):
+        generate_page_recursive(self.content_dir, self.template_path, self.dest_dir, "/")
+        index_html = self._read(os.path.join(self.dest_dir, "index.html"))
+        self.assertIn("<p>Welcome <b>home</b></p>", index_html)
+
+    def test_pretty_output(self):
+        generate_page_recursive(
+            self.content_dir, self.template_path, self.dest_dir, "/", pretty=True
+        )
+        index_html = self._read(os.path.join(self.dest_dir, "index.html"))
+        self.assertNotIn("<b>home</b>", index_html)
+        self.assertIn("<b>\n", index_html)
+
+    def test_unchanged_pages_are_skipped(self):
+        self._build()
+        index_path = os.path.join(self.dest_dir, "index.html")
+        post_path = os.path.join(self.dest_dir, "blog", "post", "index.html")
+        self._write(index_path, "sentinel")
+        post_mtime = os.stat(post_path).st_mtime_ns
+
+        self._build()
+
+        # Tampered output is regenerated, untouched output is left alone
+        self.assertIn("Welcome", self._read(index_path))
+        self.assertEqual(os.stat(post_path).st_mtime_ns, post_mtime)
+        self.assertTrue(os.path.exists(self.cache_path))
+        # The cache lives outside the output tree
+        self.assertEqual(sorted(os.listdir(self.dest_dir)), ["blog", "index.html"])
+
+    def test_non_ascii_page_is_skipped_when_unchanged(self):
+        index_path = os.path.join(self.dest_dir, "index.html")
+        self._write(os.path.join(self.content_dir, "index.md"), "# Café\n\nNaïve “quotes”")
+        self._build()
+        mtime = os.stat(index_path).st_mtime_ns
+
+        self._build()
+        # The digest recorded while streaming matches the UTF-8 file on disk
+        self.assertEqual(os.stat(index_path).st_mtime_ns, mtime)
+        with open(index_path, "rb") as f:
+            self.assertIn("Naïve “quotes”".encode("utf-8"), f.read())
+
+    def test_without_cache_path_every_page_is_rebuilt(self):
+        generate_page_recursive(self.content_dir, self.template_path, self.dest_dir, "/")
+        post_path = os.path.join(self.dest_dir, "blog", "post", "index.html")
+        self._write(post_path, "sentinel")
+        generate_page_recursive(self.content_dir, self.template_path, self.dest_dir, "/")
+        self.assertIn("Post", self._read(post_path))
+
+    def test_returns_generated_page_paths(self):
+        self._build()
+        paths = self._build()
+        self.assertEqual(
+            sorted(paths),
+            sorted([
+                os.path.join(self.dest_dir, "blog", "post", "index.html"),
+                os.path.join(self.dest_dir, "index.html"),
+            ]),
+        )
+
+    def test_changed_inputs_are_rebuilt(self):
+        self._build()
+
+        source_path = os.path.join(self.content_dir, "index.md")
+        self._write(source_path, "# Home\n\nUpdated")
+        stat = os.stat(source_path)
+        os.utime(source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self._build()
+        self.assertIn("Updated", self._read(os.path.join(self.dest_dir, "index.html")))
+
+        self._build("/other/")
+        self.assertIn('href="/other/"', self._read(os.path.join(self.dest_dir, "index.html")))
+
+    def test_changed_template_is_reloaded(self):
+        generate_page_recursive(self.content_dir, self.template_path, self.dest_dir, "/")
+
+        self._write(self.template_path, "<main>{{ Content }}</main>")
+        stat = os.stat(self.template_path)
+        os.utime(self.template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        generate_page_recursive(self.content_dir, self.template_path, self.dest_dir, "/")
+        self.assertTrue(
+            self._read(os.path.join(self.dest_dir, "index.html")).startswith("<main>")
+        )
+
+    def test_many_pages_rendered_in_pool(self):
+        # More stale pages than one batch holds, so they go to the process pool
+        for i in range(20):
+            self._write(os.path.join(self.content_dir, f"page{i}.md"), f"# Page {i}\n\nBody {i}")
+        generate_page_recursive(self.content_dir, self.template_path, self.dest_dir, "/")
+        for i in range(20):
+            page_html = self._read(os.path.join(self.dest_dir, f"page{i}.html"))
+            self.assertIn(f"<title>Page {i}</title>", page_html)
+            self.assertIn(f"<p>Body {i}</p>", page_html)
+
+    def test_template_with_repeated_content_placeholder(self):
+        self._write(self.template_path, "<a>{{ Content }}</a><b>{{ Content }}</b>")
+        generate_page_recursive(self.content_dir, self.template_path, self.dest_dir, "/")
+        index_html = self._read(os.path.join(self.dest_dir, "index.html"))
+        self.assertEqual(index_html.count("<p>Welcome <b>home</b></p>"), 2)
+
+    def test_skips_non_markdown_and_empty_dirs(self):
+        generate_page_recursive(self.content_dir, self.template_path, self.dest_dir, "/")
+        self.assertFalse(os.path.exists(os.path.join(self.dest_dir, "notes.txt")))
+        self.assertFalse(os.path.exists(os.path.join(self.dest_dir, "notes.html")))
+        self.assertFalse(os.path.exists(os.path.join(self.dest_dir, "empty")))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,216 +1,233 @@
-import unittest
+import pytest
 
 from htmlnode import HTMLNode, LeafNode, ParentNode, text_node_to_html_node
 from textnode import TextNode, TextType
 
 
-class TestHTMLNode(unittest.TestCase):
-    def test_props_to_html_single_prop(self):
-        node = HTMLNode("a", "Click me", None, {"href": "https://www.google.com"})
-        self.assertEqual(node.props_to_html(), ' href="https://www.google.com"')
-
-    def test_props_to_html_multiple_props(self):
-        node = HTMLNode(
-            "a",
-            "Click me",
-            None,
-            {"href": "https://www.google.com", "target": "_blank"}
-        )
-        result = node.props_to_html()
-        self.assertIn(' href="https://www.google.com"', result)
-        self.assertIn(' target="_blank"', result)
-
-    def test_props_to_html_empty(self):
-        node = HTMLNode("p", "Hello")
-        self.assertEqual(node.props_to_html(), "")
-
-    def test_props_to_html_none(self):
-        node = HTMLNode("p", "Hello", None, None)
-        self.assertEqual(node.props_to_html(), "")
-
-    def test_to_html_raises(self):
-        node = HTMLNode("p", "Hello")
-        with self.assertRaises(NotImplementedError):
-            node.to_html()
-
-    def test_repr(self):
-        node = HTMLNode("p", "Hello", None, {"class": "greeting"})
-        self.assertEqual(
-            repr(node),
-            "HTMLNode(p, Hello, None, {'class': 'greeting'})"
-        )
-
-
-class TestLeafNode(unittest.TestCase):
-    def test_leaf_to_html_p(self):
-        node = LeafNode("p", "Hello, world!")
-        self.assertEqual(node.to_html(), "<p>Hello, world!</p>")
-
-    def test_leaf_to_html_a(self):
-        node = LeafNode("a", "Click me!", {"href": "https://www.google.com"})
-        self.assertEqual(node.to_html(), '<a href="https://www.google.com">Click me!</a>')
-
-    def test_leaf_to_html_b(self):
-        node = LeafNode("b", "Bold text")
-        self.assertEqual(node.to_html(), "<b>Bold text</b>")
-
-    def test_leaf_to_html_i(self):
-        node = LeafNode("i", "Italic text")
-        self.assertEqual(node.to_html(), "<i>Italic text</i>")
-
-    def test_leaf_to_html_no_tag(self):
-        node = LeafNode(None, "Just raw text")
-        self.assertEqual(node.to_html(), "Just raw text")
-
-    def test_leaf_to_html_no_value_raises(self):
-        node = LeafNode("p", None)
-        with self.assertRaises(ValueError):
-            node.to_html()
-
-    def test_leaf_to_html_with_multiple_props(self):
-        node = LeafNode("a", "Link", {"href": "https://boot.dev", "target": "_blank"})
-        result = node.to_html()
-        self.assertIn("<a", result)
-        self.assertIn("</a>", result)
-        self.assertIn('href="https://boot.dev"', result)
-        self.assertIn('target="_blank"', result)
-        self.assertIn(">Link<", result)
-
-    def test_leaf_repr(self):
-        node = LeafNode("p", "Hello", {"class": "text"})
-        self.assertEqual(repr(node), "LeafNode(p, Hello, {'class': 'text'})")
-
-
-class TestParentNode(unittest.TestCase):
-    def test_to_html_with_children(self):
-        child_node = LeafNode("span", "child")
-        parent_node = ParentNode("div", [child_node])
-        self.assertEqual(parent_node.to_html(), "<div><span>child</span></div>")
-
-    def test_to_html_with_grandchildren(self):
-        grandchild_node = LeafNode("b", "grandchild")
-        child_node = ParentNode("span", [grandchild_node])
-        parent_node = ParentNode("div", [child_node])
-        self.assertEqual(
-            parent_node.to_html(),
-            "<div><span><b>grandchild</b></span></div>",
-        )
-
-    def test_to_html_multiple_children(self):
-        node = ParentNode(
-            "p",
-            [
-                LeafNode("b", "Bold text"),
-                LeafNode(None, "Normal text"),
-                LeafNode("i", "italic text"),
-                LeafNode(None, "Normal text"),
-            ],
-        )
-        self.assertEqual(
-            node.to_html(),
-            "<p><b>Bold text</b>Normal text<i>italic text</i>Normal text</p>"
-        )
-
-    def test_to_html_no_tag_raises(self):
-        child_node = LeafNode("span", "child")
-        parent_node = ParentNode(None, [child_node])
-        with self.assertRaises(ValueError) as context:
-            parent_node.to_html()
-        self.assertIn("tag", str(context.exception).lower())
-
-    def test_to_html_no_children_raises(self):
-        parent_node = ParentNode("div", None)
-        with self.assertRaises(ValueError) as context:
-            parent_node.to_html()
-        self.assertIn("children", str(context.exception).lower())
-
-    def test_to_html_empty_children(self):
-        parent_node = ParentNode("div", [])
-        self.assertEqual(parent_node.to_html(), "<div></div>")
-
-    def test_to_html_with_props(self):
-        child_node = LeafNode("span", "content")
-        parent_node = ParentNode("div", [child_node], {"class": "container"})
-        self.assertEqual(
-            parent_node.to_html(),
-            '<div class="container"><span>content</span></div>'
-        )
-
-    def test_to_html_deeply_nested(self):
-        # Create a deeply nested structure: div > section > article > p > span > text
-        innermost = LeafNode("span", "deep text")
-        level4 = ParentNode("p", [innermost])
-        level3 = ParentNode("article", [level4])
-        level2 = ParentNode("section", [level3])
-        level1 = ParentNode("div", [level2])
-        self.assertEqual(
-            level1.to_html(),
-            "<div><section><article><p><span>deep text</span></p></article></section></div>"
-        )
-
-    def test_to_html_mixed_children(self):
-        # Parent with both ParentNode and LeafNode children
-        nested_parent = ParentNode("span", [LeafNode("b", "bold")])
-        node = ParentNode(
-            "div",
-            [
-                LeafNode(None, "Text before "),
-                nested_parent,
-                LeafNode(None, " text after"),
-            ]
-        )
-        self.assertEqual(
-            node.to_html(),
-            "<div>Text before <span><b>bold</b></span> text after</div>"
-        )
-
-    def test_repr(self):
-        child = LeafNode("span", "hi")
-        parent = ParentNode("div", [child], {"id": "main"})
-        result = repr(parent)
-        self.assertIn("ParentNode", result)
-        self.assertIn("div", result)
-
-
-class TestTextNodeToHtmlNode(unittest.TestCase):
-    def test_text(self):
-        node = TextNode("This is a text node", TextType.TEXT)
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, None)
-        self.assertEqual(html_node.value, "This is a text node")
-
-    def test_bold(self):
-        node = TextNode("Bold text", TextType.BOLD)
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, "b")
-        self.assertEqual(html_node.value, "Bold text")
-
-    def test_italic(self):
-        node = TextNode("Italic text", TextType.ITALIC)
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, "i")
-        self.assertEqual(html_node.value, "Italic text")
-
-    def test_code(self):
-        node = TextNode("print('hello')", TextType.CODE)
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, "code")
-        self.assertEqual(html_node.value, "print('hello')")
-
-    def test_link(self):
-        node = TextNode("Click here", TextType.LINK, "https://www.boot.dev")
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, "a")
-        self.assertEqual(html_node.value, "Click here")
-        self.assertEqual(html_node.props, {"href": "https://www.boot.dev"})
-
-    def test_image(self):
-        node = TextNode("Alt text", TextType.IMAGE, "https://example.com/image.png")
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, "img")
-        self.assertEqual(html_node.value, "")
-        self.assertEqual(html_node.props, {"src": "https://example.com/image.png", "alt": "Alt text"})
-
-
-if __name__ == "__main__":
-    unittest.main()
+def test_props_to_html_single_prop():
+    node = HTMLNode("a", "Click me", None, {"href": "https://www.google.com"})
+    assert node.props_to_html() == ' href="https://www.google.com"'
+
+
+def test_props_to_html_multiple_props():
+    node = HTMLNode(
+        "a",
+        "Click me",
+        None,
+        {"href": "https://www.google.com", "target": "_blank"}
+    )
+    result = node.props_to_html()
+    assert ' href="https://www.google.com"' in result
+    assert ' target="_blank"' in result
+
+
+def test_props_to_html_empty():
+    node = HTMLNode("p", "Hello")
+    assert node.props_to_html() == ""
+
+
+def test_props_to_html_none():
+    node = HTMLNode("p", "Hello", None, None)
+    assert node.props_to_html() == ""
+
+
+def test_html_node_to_html_raises():
+    node = HTMLNode("p", "Hello")
+    with pytest.raises(NotImplementedError):
+        node.to_html()
+
+
+def test_html_node_repr():
+    node = HTMLNode("p", "Hello", None, {"class": "greeting"})
+    assert repr(node) == "HTMLNode(p, Hello, None, {'class': 'greeting'})"
+
+
+def test_leaf_to_html_p():
+    node = LeafNode("p", "Hello, world!")
+    assert node.to_html() == "<p>Hello, world!</p>"
+
+
+def test_leaf_to_html_a():
+    node = LeafNode("a", "Click me!", {"href": "https://www.google.com"})
+    assert node.to_html() == '<a href="https://www.google.com">Click me!</a>'
+
+
+def test_leaf_to_html_b():
+    node = LeafNode("b", "Bold text")
+    assert node.to_html() == "<b>Bold text</b>"
+
+
+def test_leaf_to_html_i():
+    node = LeafNode("i", "Italic text")
+    assert node.to_html() == "<i>Italic text</i>"
+
+
+def test_leaf_to_html_no_tag():
+    node = LeafNode(None, "Just raw text")
+    assert node.to_html() == "Just raw text"
+
+
+def test_leaf_to_html_no_value_raises():
+    node = LeafNode("p", None)
+    with pytest.raises(ValueError):
+        node.to_html()
+
+
+def test_leaf_to_html_with_multiple_props():
+    node = LeafNode("a", "Link", {"href": "https://boot.dev", "target": "_blank"})
+    result = node.to_html()
+    assert "<a" in result
+    assert "</a>" in result
+    assert 'href="https://boot.dev"' in result
+    assert 'target="_blank"' in result
+    assert ">Link<" in result
+
+
+def test_leaf_repr():
+    node = LeafNode("p", "Hello", {"class": "text"})
+    assert repr(node) == "LeafNode(p, Hello, {'class': 'text'})"
+
+
+def test_parent_to_html_with_children():
+    child_node = LeafNode("span", "child")
+    parent_node = ParentNode("div", [child_node])
+    assert parent_node.to_html() == "<div><span>child</span></div>"
+
+
+def test_parent_to_html_with_grandchildren():
+    grandchild_node = LeafNode("b", "grandchild")
+    child_node = ParentNode("span", [grandchild_node])
+    parent_node = ParentNode("div", [child_node])
+    assert parent_node.to_html() == "<div><span><b>grandchild</b></span></div>"
+
+
+def test_parent_to_html_multiple_children():
+    node = ParentNode(
+        "p",
+        [
+            LeafNode("b", "Bold text"),
+            LeafNode(None, "Normal text"),
+            LeafNode("i", "italic text"),
+            LeafNode(None, "Normal text"),
+        ],
+    )
+    assert node.to_html() == "<p><b>Bold text</b>Normal text<i>italic text</i>Normal text</p>"
+
+
+def test_parent_to_html_no_tag_raises():
+    child_node = LeafNode("span", "child")
+    parent_node = ParentNode(None, [child_node])
+    with pytest.raises(ValueError) as context:
+        parent_node.to_html()
+    assert "tag" in str(context.value).lower()
+
+
+def test_parent_to_html_no_children_raises():
+    parent_node = ParentNode("div", None)
+    with pytest.raises(ValueError) as context:
+        parent_node.to_html()
+    assert "children" in str(context.value).lower()
+
+
+def test_parent_to_html_empty_children():
+    parent_node = ParentNode("div", [])
+    assert parent_node.to_html() == "<div></div>"
+
+
+def test_parent_to_html_with_props():
+    child_node = LeafNode("span", "content")
+    parent_node = ParentNode("div", [child_node], {"class": "container"})
+    assert parent_node.to_html() == '<div class="container"><span>content</span></div>'
+
+
+def test_parent_to_html_deeply_nested():
+    # Create a deeply nested structure: div > section > article > p > span > text
+    innermost = LeafNode("span", "deep text")
+    level4 = ParentNode("p", [innermost])
+    level3 = ParentNode("article", [level4])
+    level2 = ParentNode("section", [level3])
+    level1 = ParentNode("div", [level2])
+    assert level1.to_html() == (
+        "<div><section><article><p><span>deep text</span></p></article></section></div>"
+    )
+
+
+def test_parent_to_html_deeper_than_recursion_limit():
+    node = LeafNode(None, "x")
+    for _ in range(5000):
+        node = ParentNode("span", [node])
+    assert node.to_html() == "<span>" * 5000 + "x" + "</span>" * 5000
+
+
+def test_parent_to_html_nested_no_tag_raises():
+    parent_node = ParentNode("div", [ParentNode(None, [LeafNode("b", "x")])])
+    with pytest.raises(ValueError) as context:
+        parent_node.to_html()
+    assert "tag" in str(context.value).lower()
+
+
+def test_parent_to_html_mixed_children():
+    # Parent with both ParentNode and LeafNode children
+    nested_parent = ParentNode("span", [LeafNode("b", "bold")])
+    node = ParentNode(
+        "div",
+        [
+            LeafNode(None, "Text before "),
+            nested_parent,
+            LeafNode(None, " text after"),
+        ]
+    )
+    assert node.to_html() == "<div>Text before <span><b>bold</b></span> text after</div>"
+
+
+def test_parent_repr():
+    child = LeafNode("span", "hi")
+    parent = ParentNode("div", [child], {"id": "main"})
+    result = repr(parent)
+    assert "ParentNode" in result
+    assert "div" in result
+
+
+def test_text_node_to_html_node_text():
+    node = TextNode("This is a text node", TextType.TEXT)
+    html_node = text_node_to_html_node(node)
+    assert html_node.tag is None
+    assert html_node.value == "This is a text node"
+
+
+def test_text_node_to_html_node_bold():
+    node = TextNode("Bold text", TextType.BOLD)
+    html_node = text_node_to_html_node(node)
+    assert html_node.tag == "b"
+    assert html_node.value == "Bold text"
+
+
+def test_text_node_to_html_node_italic():
+    node = TextNode("Italic text", TextType.ITALIC)
+    html_node = text_node_to_html_node(node)
+    assert html_node.tag == "i"
+    assert html_node.value == "Italic text"
+
+
+def test_text_node_to_html_node_code():
+    node = TextNode("print('hello')", TextType.CODE)
+    html_node = text_node_to_html_node(node)
+    assert html_node.tag == "code"
+    assert html_node.value == "print('hello')"
+
+
+def test_text_node_to_html_node_link():
+    node = TextNode("Click here", TextType.LINK, "https://www.boot.dev")
+    html_node = text_node_to_html_node(node)
+    assert html_node.tag == "a"
+    assert html_node.value == "Click here"
+    assert html_node.props == {"href": "https://www.boot.dev"}
+
+
+def test_text_node_to_html_node_image():
+    node = TextNode("Alt text", TextType.IMAGE, "https://example.com/image.png")
+    html_node = text_node_to_html_node(node)
+    assert html_node.tag == "img"
+    assert html_node.value == ""
+    assert html_node.props == {"src": "https://example.com/image.png", "alt": "Alt text"}
+
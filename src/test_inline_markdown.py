@@ -1,271 +1,250 @@
-import unittest
+import re
+
+import pytest
 
 from inline_markdown import (extract_markdown_images, extract_markdown_links,
                              split_nodes_delimiter, split_nodes_image,
-                             split_nodes_link, text_to_textnodes)
+                             split_nodes_link, text_node_to_html_node,
+                             text_node_to_html_str, text_to_textnodes)
 from textnode import TextNode, TextType
 
 
-class TestSplitNodesDelimiter(unittest.TestCase):
-    def test_split_code(self):
-        node = TextNode("This is text with a `code block` word", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        self.assertListEqual(
+@pytest.mark.parametrize(
+    "text, delimiter, text_type, expected",
+    [
+        pytest.param(
+            "This is text with a `code block` word",
+            "`",
+            TextType.CODE,
             [
                 TextNode("This is text with a ", TextType.TEXT),
                 TextNode("code block", TextType.CODE),
                 TextNode(" word", TextType.TEXT),
             ],
-            new_nodes,
-        )
-
-    def test_split_bold(self):
-        node = TextNode("This is **bold** text", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        self.assertListEqual(
+            id="split_code",
+        ),
+        pytest.param(
+            "This is **bold** text",
+            "**",
+            TextType.BOLD,
             [
                 TextNode("This is ", TextType.TEXT),
                 TextNode("bold", TextType.BOLD),
                 TextNode(" text", TextType.TEXT),
             ],
-            new_nodes,
-        )
-
-    def test_split_italic(self):
-        node = TextNode("This is _italic_ text", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "_", TextType.ITALIC)
-        self.assertListEqual(
+            id="split_bold",
+        ),
+        pytest.param(
+            "This is _italic_ text",
+            "_",
+            TextType.ITALIC,
             [
                 TextNode("This is ", TextType.TEXT),
                 TextNode("italic", TextType.ITALIC),
                 TextNode(" text", TextType.TEXT),
             ],
-            new_nodes,
-        )
-
-    def test_split_multiple_delimiters(self):
-        node = TextNode("This has **two** bold **words**", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        self.assertListEqual(
+            id="split_italic",
+        ),
+        pytest.param(
+            "This has **two** bold **words**",
+            "**",
+            TextType.BOLD,
             [
                 TextNode("This has ", TextType.TEXT),
                 TextNode("two", TextType.BOLD),
                 TextNode(" bold ", TextType.TEXT),
                 TextNode("words", TextType.BOLD),
             ],
-            new_nodes,
-        )
-
-    def test_non_text_node_unchanged(self):
-        node = TextNode("already bold", TextType.BOLD)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        self.assertListEqual([node], new_nodes)
-
-    def test_no_delimiter_in_text(self):
-        node = TextNode("Plain text with no formatting", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        self.assertListEqual(
+            id="split_multiple_delimiters",
+        ),
+        pytest.param(
+            "Plain text with no formatting",
+            "**",
+            TextType.BOLD,
             [TextNode("Plain text with no formatting", TextType.TEXT)],
-            new_nodes,
-        )
-
-    def test_unclosed_delimiter_raises(self):
-        node = TextNode("This has **unclosed bold", TextType.TEXT)
-        with self.assertRaises(ValueError):
-            split_nodes_delimiter([node], "**", TextType.BOLD)
-
-
-class TestExtractMarkdownImages(unittest.TestCase):
-    def test_extract_single_image(self):
-        text = "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png)"
-        matches = extract_markdown_images(text)
-        self.assertListEqual([("image", "https://i.imgur.com/zjjcJKZ.png")], matches)
-
-    def test_extract_multiple_images(self):
-        text = "![rick roll](https://i.imgur.com/aKaOqIh.gif) and ![obi wan](https://i.imgur.com/fJRm4Vk.jpeg)"
-        matches = extract_markdown_images(text)
-        self.assertListEqual(
+            id="no_delimiter_in_text",
+        ),
+    ],
+)
+def test_split_nodes_delimiter(text, delimiter, text_type, expected):
+    node = TextNode(text, TextType.TEXT)
+    assert split_nodes_delimiter([node], delimiter, text_type) == expected
+
+
+def test_split_nodes_delimiter_non_text_node_unchanged():
+    node = TextNode("already bold", TextType.BOLD)
+    assert split_nodes_delimiter([node], "**", TextType.BOLD) == [node]
+
+
+def test_split_nodes_delimiter_unclosed_raises():
+    node = TextNode("This has **unclosed bold", TextType.TEXT)
+    with pytest.raises(ValueError):
+        split_nodes_delimiter([node], "**", TextType.BOLD)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        pytest.param(
+            "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png)",
+            [("image", "https://i.imgur.com/zjjcJKZ.png")],
+            id="single_image",
+        ),
+        pytest.param(
+            "![rick roll](https://i.imgur.com/aKaOqIh.gif) and ![obi wan](https://i.imgur.com/fJRm4Vk.jpeg)",
             [
                 ("rick roll", "https://i.imgur.com/aKaOqIh.gif"),
                 ("obi wan", "https://i.imgur.com/fJRm4Vk.jpeg"),
             ],
-            matches,
-        )
-
-    def test_no_images(self):
-        text = "No images here"
-        matches = extract_markdown_images(text)
-        self.assertListEqual([], matches)
-
-
-class TestExtractMarkdownLinks(unittest.TestCase):
-    def test_extract_single_link(self):
-        text = "This is a [link](https://www.boot.dev)"
-        matches = extract_markdown_links(text)
-        self.assertListEqual([("link", "https://www.boot.dev")], matches)
-
-    def test_extract_multiple_links(self):
-        text = "[to boot dev](https://www.boot.dev) and [to youtube](https://www.youtube.com)"
-        matches = extract_markdown_links(text)
-        self.assertListEqual(
+            id="multiple_images",
+        ),
+        pytest.param("No images here", [], id="no_images"),
+        pytest.param("![a [b] c](u.png)", [], id="brackets_in_alt_text"),
+        pytest.param("![a](u(1).png)", [], id="parentheses_in_url"),
+        pytest.param("!![i](u)", [("i", "u")], id="double_bang"),
+        pytest.param(
+            "x![img](i.png)[link](l)",
+            [("img", "i.png")],
+            id="link_right_after_image",
+        ),
+    ],
+)
+def test_extract_markdown_images(text, expected):
+    assert extract_markdown_images(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        pytest.param(
+            "This is a [link](https://www.boot.dev)",
+            [("link", "https://www.boot.dev")],
+            id="single_link",
+        ),
+        pytest.param(
+            "[to boot dev](https://www.boot.dev) and [to youtube](https://www.youtube.com)",
             [
                 ("to boot dev", "https://www.boot.dev"),
                 ("to youtube", "https://www.youtube.com"),
             ],
-            matches,
-        )
-
-    def test_no_links(self):
-        text = "No links here"
-        matches = extract_markdown_links(text)
-        self.assertListEqual([], matches)
-
-    def test_image_not_extracted_as_link(self):
-        text = "![image](https://example.com/img.png) and [link](https://example.com)"
-        matches = extract_markdown_links(text)
-        self.assertListEqual([("link", "https://example.com")], matches)
-
-
-class TestSplitNodesImage(unittest.TestCase):
-    def test_split_images(self):
-        node = TextNode(
+            id="multiple_links",
+        ),
+        pytest.param("No links here", [], id="no_links"),
+        pytest.param(
+            "![image](https://example.com/img.png) and [link](https://example.com)",
+            [("link", "https://example.com")],
+            id="image_not_extracted_as_link",
+        ),
+        pytest.param("!![i](u)", [], id="double_bang_is_an_image"),
+        pytest.param("see![l](u) and [k](v)", [("k", "v")], id="bang_before_link"),
+        pytest.param("[a [b] c](u)", [], id="brackets_in_link_text"),
+        pytest.param(
+            "x![img](i.png)[link](l)",
+            [("link", "l")],
+            id="link_right_after_image",
+        ),
+    ],
+)
+def test_extract_markdown_links(text, expected):
+    assert extract_markdown_links(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        pytest.param(
             "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png) and another ![second image](https://i.imgur.com/3elNhQu.png)",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual(
             [
                 TextNode("This is text with an ", TextType.TEXT),
                 TextNode("image", TextType.IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
                 TextNode(" and another ", TextType.TEXT),
                 TextNode("second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"),
             ],
-            new_nodes,
-        )
-
-    def test_no_images(self):
-        node = TextNode("No images here", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual([node], new_nodes)
-
-    def test_image_at_start(self):
-        node = TextNode("![image](https://example.com/img.png) followed by text", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual(
+            id="split_images",
+        ),
+        pytest.param(
+            "No images here",
+            [TextNode("No images here", TextType.TEXT)],
+            id="no_images",
+        ),
+        pytest.param(
+            "![image](https://example.com/img.png) followed by text",
             [
                 TextNode("image", TextType.IMAGE, "https://example.com/img.png"),
                 TextNode(" followed by text", TextType.TEXT),
             ],
-            new_nodes,
-        )
-
-    def test_image_at_end(self):
-        node = TextNode("Text followed by ![image](https://example.com/img.png)", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual(
+            id="image_at_start",
+        ),
+        pytest.param(
+            "Text followed by ![image](https://example.com/img.png)",
             [
                 TextNode("Text followed by ", TextType.TEXT),
                 TextNode("image", TextType.IMAGE, "https://example.com/img.png"),
             ],
-            new_nodes,
-        )
-
-
-class TestSplitNodesLink(unittest.TestCase):
-    def test_split_links(self):
-        node = TextNode(
+            id="image_at_end",
+        ),
+    ],
+)
+def test_split_nodes_image(text, expected):
+    assert split_nodes_image([TextNode(text, TextType.TEXT)]) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        pytest.param(
             "This is text with a link [to boot dev](https://www.boot.dev) and [to youtube](https://www.youtube.com/@bootdotdev)",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_link([node])
-        self.assertListEqual(
             [
                 TextNode("This is text with a link ", TextType.TEXT),
                 TextNode("to boot dev", TextType.LINK, "https://www.boot.dev"),
                 TextNode(" and ", TextType.TEXT),
                 TextNode("to youtube", TextType.LINK, "https://www.youtube.com/@bootdotdev"),
             ],
-            new_nodes,
-        )
+            id="split_links",
+        ),
+        pytest.param(
+            "No links here",
+            [TextNode("No links here", TextType.TEXT)],
+            id="no_links",
+        ),
+    ],
+)
+def test_split_nodes_link(text, expected):
+    assert split_nodes_link([TextNode(text, TextType.TEXT)]) == expected
 
-    def test_no_links(self):
-        node = TextNode("No links here", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        self.assertListEqual([node], new_nodes)
 
+def test_text_to_textnodes_full_example(full_markdown_text, full_markdown_expected):
+    assert text_to_textnodes(full_markdown_text) == full_markdown_expected
 
-class TestTextToTextNodes(unittest.TestCase):
-    def test_full_example(self):
-        text = "This is **text** with an _italic_ word and a `code block` and an ![obi wan image](https://i.imgur.com/fJRm4Vk.jpeg) and a [link](https://boot.dev)"
-        nodes = text_to_textnodes(text)
-        self.assertListEqual(
-            [
-                TextNode("This is ", TextType.TEXT),
-                TextNode("text", TextType.BOLD),
-                TextNode(" with an ", TextType.TEXT),
-                TextNode("italic", TextType.ITALIC),
-                TextNode(" word and a ", TextType.TEXT),
-                TextNode("code block", TextType.CODE),
-                TextNode(" and an ", TextType.TEXT),
-                TextNode("obi wan image", TextType.IMAGE, "https://i.imgur.com/fJRm4Vk.jpeg"),
-                TextNode(" and a ", TextType.TEXT),
-                TextNode("link", TextType.LINK, "https://boot.dev"),
-            ],
-            nodes,
-        )
 
-    def test_plain_text(self):
-        text = "Just plain text with no formatting"
-        nodes = text_to_textnodes(text)
-        self.assertListEqual(
+def test_text_node_to_html_str_full_example(full_markdown_expected):
+    for node in full_markdown_expected:
+        assert text_node_to_html_str(node) == text_node_to_html_node(node).to_html()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        pytest.param(
+            "Just plain text with no formatting",
             [TextNode("Just plain text with no formatting", TextType.TEXT)],
-            nodes,
-        )
-
-    def test_only_bold(self):
-        text = "**bold text**"
-        nodes = text_to_textnodes(text)
-        self.assertListEqual(
-            [TextNode("bold text", TextType.BOLD)],
-            nodes,
-        )
-
-    def test_only_italic(self):
-        text = "_italic text_"
-        nodes = text_to_textnodes(text)
-        self.assertListEqual(
-            [TextNode("italic text", TextType.ITALIC)],
-            nodes,
-        )
-
-    def test_only_code(self):
-        text = "`code block`"
-        nodes = text_to_textnodes(text)
-        self.assertListEqual(
-            [TextNode("code block", TextType.CODE)],
-            nodes,
-        )
-
-    def test_only_image(self):
-        text = "![alt text](https://example.com/image.png)"
-        nodes = text_to_textnodes(text)
-        self.assertListEqual(
+            id="plain_text",
+        ),
+        pytest.param("**bold text**", [TextNode("bold text", TextType.BOLD)], id="only_bold"),
+        pytest.param("_italic text_", [TextNode("italic text", TextType.ITALIC)], id="only_italic"),
+        pytest.param("`code block`", [TextNode("code block", TextType.CODE)], id="only_code"),
+        pytest.param(
+            "![alt text](https://example.com/image.png)",
             [TextNode("alt text", TextType.IMAGE, "https://example.com/image.png")],
-            nodes,
-        )
-
-    def test_only_link(self):
-        text = "[click here](https://example.com)"
-        nodes = text_to_textnodes(text)
-        self.assertListEqual(
+            id="only_image",
+        ),
+        pytest.param(
+            "[click here](https://example.com)",
             [TextNode("click here", TextType.LINK, "https://example.com")],
-            nodes,
-        )
-
-    def test_multiple_same_type(self):
-        text = "This has **two** different **bold** words"
-        nodes = text_to_textnodes(text)
-        self.assertListEqual(
+            id="only_link",
+        ),
+        pytest.param(
+            "This has **two** different **bold** words",
             [
                 TextNode("This has ", TextType.TEXT),
                 TextNode("two", TextType.BOLD),
@@ -273,26 +252,83 @@ class TestTextToTextNodes(unittest.TestCase):
                 TextNode("bold", TextType.BOLD),
                 TextNode(" words", TextType.TEXT),
             ],
-            nodes,
-        )
-
-    def test_bold_and_italic_together(self):
-        text = "**bold** and _italic_"
-        nodes = text_to_textnodes(text)
-        self.assertListEqual(
+            id="multiple_same_type",
+        ),
+        pytest.param(
+            "**bold** and _italic_",
             [
                 TextNode("bold", TextType.BOLD),
                 TextNode(" and ", TextType.TEXT),
                 TextNode("italic", TextType.ITALIC),
             ],
-            nodes,
-        )
-
-    def test_empty_string(self):
-        text = ""
-        nodes = text_to_textnodes(text)
-        self.assertListEqual([], nodes)
-
+            id="bold_and_italic_together",
+        ),
+        pytest.param("", [], id="empty_string"),
+        pytest.param(
+            "a `x_y_z` b",
+            [
+                TextNode("a ", TextType.TEXT),
+                TextNode("x_y_z", TextType.CODE),
+                TextNode(" b", TextType.TEXT),
+            ],
+            id="delimiter_inside_code_is_literal",
+        ),
+        pytest.param(
+            "[l](http://a.com/x_y)",
+            [TextNode("l", TextType.LINK, "http://a.com/x_y")],
+            id="delimiter_inside_link_url_is_literal",
+        ),
+        pytest.param(
+            "_a **b** c_",
+            [TextNode("a **b** c", TextType.ITALIC)],
+            id="no_nested_styles",
+        ),
+    ],
+)
+def test_text_to_textnodes(text, expected):
+    assert text_to_textnodes(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param("This has **unclosed bold", id="unclosed_bold"),
+        # The link is matched whole, so its ** can't pair with the trailing
+        # one, and the ` after it is left unclosed
+        pytest.param("[**](_)`**", id="delimiter_after_link"),
+    ],
+)
+def test_text_to_textnodes_unclosed_delimiter_raises(text):
+    with pytest.raises(ValueError, match="no closing delimiter"):
+        text_to_textnodes(text)
+
+
+@pytest.mark.parametrize("delimiter", ["**", "_", "`"])
+def test_text_to_textnodes_lone_delimiter_raises(delimiter):
+    text = f"**closed** and {delimiter}unclosed"
+    with pytest.raises(ValueError, match=f"no closing delimiter '{re.escape(delimiter)}'"):
+        text_to_textnodes(text)
+
+
+def test_text_node_to_html_str_matches_leaf_node_html():
+    nodes = [
+        TextNode("plain", TextType.TEXT),
+        TextNode("bold", TextType.BOLD),
+        TextNode("italic", TextType.ITALIC),
+        TextNode("code", TextType.CODE),
+        TextNode("link", TextType.LINK, "https://example.com"),
+        TextNode("alt", TextType.IMAGE, "https://example.com/img.png"),
+    ]
+    for node in nodes:
+        assert text_node_to_html_str(node) == text_node_to_html_node(node).to_html()
+
+
+def test_text_node_to_html_str_image():
+    node = TextNode("alt", TextType.IMAGE, "img.png")
+    assert text_node_to_html_str(node) == '<img src="img.png" alt="alt"></img>'
+
+
+def test_text_node_to_html_str_invalid_type_raises():
+    with pytest.raises(ValueError):
+        text_node_to_html_str(TextNode("x", "not a type"))
 
-if __name__ == "__main__":
-    unittest.main()
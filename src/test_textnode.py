@@ -1,41 +1,73 @@
-import unittest
+import dataclasses
+
+import pytest
 
 from textnode import TextNode, TextType
 
-class TestTextNode(unittest.TestCase):
-    def test_eq(self):
-        node = TextNode("This is a text node", TextType.BOLD)
-        node2 = TextNode("This is a text node", TextType.BOLD)
-        self.assertEqual(node, node2)
-
-    def test_eq_with_url(self):
-        node = TextNode("Click here", TextType.LINK, "https://example.com")
-        node2 = TextNode("Click here", TextType.LINK, "https://example.com")
-        self.assertEqual(node, node2)
-
-    def test_not_eq_different_text(self):
-        node = TextNode("Hello", TextType.TEXT)
-        node2 = TextNode("World", TextType.TEXT)
-        self.assertNotEqual(node, node2)
-
-    def test_not_eq_different_text_type(self):
-        node = TextNode("Same text", TextType.BOLD)
-        node2 = TextNode("Same text", TextType.ITALIC)
-        self.assertNotEqual(node, node2)
-
-    def test_not_eq_different_url(self):
-        node = TextNode("Link", TextType.LINK, "https://example.com")
-        node2 = TextNode("Link", TextType.LINK, "https://other.com")
-        self.assertNotEqual(node, node2)
-
-    def test_url_none_by_default(self):
-        node = TextNode("Text", TextType.TEXT)
-        self.assertIsNone(node.url)
-
-    def test_not_eq_url_none_vs_url_set(self):
-        node = TextNode("Link", TextType.LINK)
-        node2 = TextNode("Link", TextType.LINK, "https://example.com")
-        self.assertNotEqual(node, node2)
-
-if __name__ == "__main__":
-    unittest.main()
+
+@pytest.mark.parametrize(
+    "a, b, eq",
+    [
+        pytest.param(
+            TextNode("This is a text node", TextType.BOLD),
+            TextNode("This is a text node", TextType.BOLD),
+            True,
+            id="eq",
+        ),
+        pytest.param(
+            TextNode("Click here", TextType.LINK, "https://example.com"),
+            TextNode("Click here", TextType.LINK, "https://example.com"),
+            True,
+            id="eq_with_url",
+        ),
+        pytest.param(
+            TextNode("Hello", TextType.TEXT),
+            TextNode("World", TextType.TEXT),
+            False,
+            id="not_eq_different_text",
+        ),
+        pytest.param(
+            TextNode("Same text", TextType.BOLD),
+            TextNode("Same text", TextType.ITALIC),
+            False,
+            id="not_eq_different_text_type",
+        ),
+        pytest.param(
+            TextNode("Link", TextType.LINK, "https://example.com"),
+            TextNode("Link", TextType.LINK, "https://other.com"),
+            False,
+            id="not_eq_different_url",
+        ),
+        pytest.param(
+            TextNode("Link", TextType.LINK),
+            TextNode("Link", TextType.LINK, "https://example.com"),
+            False,
+            id="not_eq_url_none_vs_url_set",
+        ),
+    ],
+)
+def test_equality(a, b, eq):
+    assert (a == b) is eq
+    assert (a != b) is not eq
+
+
+def test_url_none_by_default():
+    node = TextNode("Text", TextType.TEXT)
+    assert node.url is None
+
+
+def test_equal_nodes_hash_equal():
+    node = TextNode("Click here", TextType.LINK, "https://example.com")
+    node2 = TextNode("Click here", TextType.LINK, "https://example.com")
+    assert hash(node) == hash(node2)
+
+
+def test_frozen():
+    node = TextNode("Text", TextType.TEXT)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        node.text = "Other"
+
+
+def test_repr():
+    node = TextNode("Click here", TextType.LINK, "https://example.com")
+    assert repr(node) == "TextNode(Click here, link, https://example.com)"
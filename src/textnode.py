@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -9,18 +10,11 @@ class TextType(Enum):
     LINK = "link"
     IMAGE = "image"
 
+@dataclass(frozen=True, slots=True)
 class TextNode:
-    def __init__(self, text, text_type, url=None):
-        self.text = text
-        self.text_type = text_type
-        self.url = url
-
-    def __eq__(self, other):
-        return (
-                self.text == other.text
-                and self.text_type == other.text_type
-                and self.url == other.url
-        )
+    text: str
+    text_type: TextType
+    url: str | None = None
 
     def __repr__(self):
         return f"TextNode({self.text}, {self.text_type.value}, {self.url})"
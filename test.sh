@@ -1,2 +1,2 @@
 #!/bin/bash
-uv run python -m unittest discover -s src
+uv run pytest -n auto src